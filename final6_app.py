@@ -1,34 +1,21 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import joblib
-import matplotlib.pyplot as plt
-import folium
-from streamlit_folium import folium_static
+import io
 import os
-import sklearn.compose._column_transformer
-import warnings
-warnings.filterwarnings('ignore')
-
-# FIX FOR MISSING CLASS - Add this at the VERY TOP
-class _RemainderColsList(list):
-    pass
-
-# Patch the missing class
-sklearn.compose._column_transformer._RemainderColsList = _RemainderColsList
-
-# Set page config
-st.set_page_config(
-    page_title="Flood Risk Prediction Dashboard",
-    page_icon="🌊",
-    layout="wide"
-)
-
-# Alert Banner on Top
-st.warning("⚠️ Always follow official guidelines during severe weather. This dashboard is only a prediction tool.", icon="🚨")
+import math
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import model_worker
+# altair, folium and pydeck are imported inside the
+# functions that use them to keep them off the cold-start path
 
-st.title("🌊 Flood Risk Prediction Dashboard")
-st.success("✅ Version compatibility fix applied")
+# No st.* calls at module level: spawned model workers re-import this
+# script as __mp_main__ (Streamlit registers it as __main__), and that
+# import must not render anything. Page setup lives in main().
 
 # Feature definitions
 NUM_FEATURES = [
@@ -40,20 +27,92 @@ NUM_FEATURES = [
 RISK_LABELS = {0: "Low", 1: "Medium", 2: "High"}
 RISK_COLORS = {"Low": "#28a745", "Medium": "#ffc107", "High": "#dc3545"}
 
+# Map marker color (RGB), impact-area radius (m) and impact-area fill/line
+# color (RGBA, matching RISK_COLORS) per risk level
+_RISK_META = {
+    "Low": ([114, 176, 38], 1000, [40, 167, 69, 51], [40, 167, 69, 255]),
+    "Medium": ([246, 151, 48], 2000, [255, 193, 7, 51], [255, 193, 7, 255]),
+    "High": ([214, 62, 42], 3000, [220, 53, 69, 51], [220, 53, 69, 255])
+}
+
+# Arrays indexed by predicted class, for vectorized batch lookups
+_RISK_LABEL_ARRAY = np.array([RISK_LABELS[i] for i in range(len(RISK_LABELS))])
+_RISK_RADII = np.array([_RISK_META[label][1] for label in _RISK_LABEL_ARRAY])
+
 # USD to INR conversion rate (approximate)
 USD_TO_INR = 83.0
 
+CLF_MODEL_PATH = 'models/clf_pipeline.joblib'
+REG_MODEL_PATH = 'models/reg_pipeline.joblib'
+
+# Model worker processes; one core is left for the Streamlit server
+POOL_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Static panel content, assembled once at import instead of on every rerun
+EMERGENCY_CONTACTS = (
+    {"name": "National Disaster Response Force (NDRF)", "number": "011-24363260", "icon": "🚨"},
+    {"name": "State Disaster Management Authority", "number": "1070", "icon": "🏛️"},
+    {"name": "Rescue Services", "number": "101", "icon": "🚑"},
+    {"name": "Ambulance (Medical Emergency)", "number": "108", "icon": "🏥"},
+    {"name": "Police", "number": "100", "icon": "👮"},
+    {"name": "Fire Department", "number": "102", "icon": "🚒"}
+)
+
+_CONTACTS_HTML = "".join(f"""
+<div style='background-color: #f8f9fa; padding: 10px; border-radius: 5px; margin: 5px 0; border-left: 4px solid #dc3545;'>
+    <strong style='color: black;'>{contact['icon']} {contact['name']}</strong><br>
+    <span style='color: black;'>📞 {contact['number']}</span>
+</div>
+""" for contact in EMERGENCY_CONTACTS)
+
+KIT_ITEMS = (
+    "💧 Water bottles (3+ days supply)",
+    "🔦 Flashlight with extra batteries",
+    "💊 Basic medicines & first aid kit",
+    "🔋 Power bank & charger",
+    "🍫 Dry snacks & non-perishable food",
+    "📄 Important documents (waterproof)",
+    "💰 Cash & emergency funds",
+    "🧥 Warm clothes & blankets",
+    "🧴 Hygiene & sanitation items",
+    "📱 Emergency contact list"
+)
+
+RELIEF_ORGANIZATIONS = (
+    {"name": "Red Cross India", "focus": "Emergency relief & medical aid", "url": "https://www.indianredcross.org/"},
+    {"name": "Goonj", "focus": "Material relief & rehabilitation", "url": "https://goonj.org/"},
+    {"name": "Hemkunt Foundation", "focus": "Disaster relief & community support", "url": "https://hemkuntfoundation.com/"},
+    {"name": "Local Municipal Relief Fund", "focus": "Direct local assistance", "url": "#"}
+)
+
+_ORGANIZATIONS_MD = "\n".join(f"""
+**{org['name']}**  
+*{org['focus']}*  
+🔗 [Learn More]({org['url']})
+""" for org in RELIEF_ORGANIZATIONS)
+
+AWARENESS_FACTS = (
+    "🌧️ **1 cm increase** in rainfall in low-elevation areas can raise flood chances by 10–15%",
+    "🏞️ **Urban areas** with >40% impervious surfaces are 3x more likely to experience flash floods",
+    "⏰ **Early warning** systems can reduce flood fatalities by up to 35%",
+    "🌳 **Natural vegetation** can absorb up to 90% of rainfall, reducing flood risk significantly",
+    "📈 **Climate change** has increased extreme rainfall events by 20% in the last decade"
+)
+
+_FACTS_MD = "\n\n".join(AWARENESS_FACTS)
+
 # Load models with enhanced error handling
 @st.cache_resource
 def load_models():
     try:
         # Show loading status
         with st.spinner("Loading machine learning models..."):
-            clf = joblib.load('models/clf_pipeline.joblib')
-            reg = joblib.load('models/reg_pipeline.joblib')
+            # The models live only in the worker processes; warm the pool up
+            # and surface any error they hit loading them
+            warm_up_pool()
         
         st.success("✅ Models loaded successfully!")
-        return clf, reg
+        return True
         
     except Exception as e:
         st.error(f"❌ Model loading failed: {e}")
@@ -78,59 +137,136 @@ def load_models():
             3. Ensure all dependencies are installed
             """)
         
-        return None, None
+        return False
+
+# Marker tooltip; pydeck fills the {field} placeholders from the layer data
+# client-side, so the template itself is built once
+_MARKER_TOOLTIP = {
+    "html": """
+    <div style="font-family: Arial; font-size: 14px;">
+        <h4 style="margin: 5px 0;">{city}</h4>
+        <hr style="margin: 8px 0;">
+        <b>Risk Level:</b> <span style="color: {risk_color}">{risk}</span><br>
+        <b>High Risk Probability:</b> {p_high}<br>
+        <b>Estimated Damage:</b> {damage}<br>
+        <b>Coordinates:</b> {coords}<br>
+    </div>
+    """,
+    "style": {"backgroundColor": "white", "color": "#333"},
+}
+
+@st.cache_resource
+def get_model_pool():
+    """Start the worker processes that own the models and serve predictions"""
+    # Inference runs off the Streamlit server process so concurrent sessions
+    # don't serialize on it; spawn avoids forking the threaded server
+    return ProcessPoolExecutor(
+        max_workers=POOL_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=model_worker.init_worker,
+        initargs=(CLF_MODEL_PATH, REG_MODEL_PATH)
+    )
+
+@st.cache_resource
+def _pool_lock():
+    """Lock serializing broken-pool replacement across sessions"""
+    # Cached rather than module-level: the script re-executes on every rerun
+    return threading.Lock()
+
+def warm_up_pool():
+    """Start every model worker and re-raise any model loading error"""
+    # The pool starts workers on demand; submitting one ping per worker
+    # concurrently starts them all now instead of during user requests
+    pool = get_model_pool()
+    futures = [pool.submit(model_worker.ping) for _ in range(POOL_WORKERS)]
+    for future in futures:
+        future.result()
+
+def run_in_pool(fn, *args):
+    """Run fn(*args) in the model pool, restarting the pool once if it broke"""
+    pool = get_model_pool()
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        # A dead worker breaks the cached pool for every session; replace it,
+        # unless another session already has
+        with _pool_lock():
+            if get_model_pool() is pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                get_model_pool.clear()
+        return get_model_pool().submit(fn, *args).result()
 
 def create_interactive_map(lat, lon, risk_level, p_high, pred_damage_inr, city_name=""):
     """Create accurate interactive map"""
+    import pydeck as pdk
+
+    # Risk-based marker and area colors
+    icon_color, risk_radius, area_fill, area_line = _RISK_META[risk_level]
+
+    data = [{
+        "position": [lon, lat],
+        "city": city_name,
+        "risk": risk_level,
+        "risk_color": RISK_COLORS[risk_level],
+        "p_high": f"{p_high:.1%}",
+        "damage": f"₹{pred_damage_inr:,.0f}",
+        "coords": f"{lat:.6f}, {lon:.6f}",
+    }]
+
+    # Risk area circle, radius in meters
+    area_layer = pdk.Layer(
+        "ScatterplotLayer",
+        data=data,
+        get_position="position",
+        get_radius=risk_radius,
+        radius_units="meters",
+        get_fill_color=area_fill,
+        get_line_color=area_line,
+        line_width_units="pixels",
+        get_line_width=3,
+        stroked=True,
+        filled=True,
+    )
+
+    # Precise marker, fixed size on screen
+    marker_layer = pdk.Layer(
+        "ScatterplotLayer",
+        data=data,
+        get_position="position",
+        get_radius=8,
+        radius_units="pixels",
+        get_fill_color=icon_color,
+        get_line_color=[255, 255, 255],
+        line_width_units="pixels",
+        get_line_width=2,
+        stroked=True,
+        pickable=True,
+    )
+
+    return pdk.Deck(
+        layers=[area_layer, marker_layer],
+        initial_view_state=pdk.ViewState(latitude=lat, longitude=lon, zoom=13),
+        map_style="road",  # light street basemap, like the old OpenStreetMap tiles
+        tooltip=_MARKER_TOOLTIP,
+    )
+
+@st.cache_resource
+def _build_picker_html():
+    """Render the coordinate picker map to HTML once and share it across reruns"""
+    import folium
+
+    # Create LARGE map centered on India
     m = folium.Map(
-        location=[lat, lon],
-        zoom_start=13,  # Increased zoom for better detail
+        location=[20.5937, 78.9629],
+        zoom_start=5,
         tiles="OpenStreetMap"
     )
-    
-    # Risk-based marker color
-    if risk_level == "High":
-        icon_color = "red"
-        risk_radius = 3000
-    elif risk_level == "Medium":
-        icon_color = "orange" 
-        risk_radius = 2000
-    else:
-        icon_color = "green"
-        risk_radius = 1000
-    
-    # Add precise marker
-    folium.Marker(
-        [lat, lon],
-        popup=folium.Popup(
-            f"""
-            <div style="font-family: Arial; font-size: 14px;">
-                <h4 style="margin: 5px 0; color: #333;">{city_name}</h4>
-                <hr style="margin: 8px 0;">
-                <b>Risk Level:</b> <span style="color: {RISK_COLORS[risk_level]}">{risk_level}</span><br>
-                <b>High Risk Probability:</b> {p_high:.1%}<br>
-                <b>Estimated Damage:</b> ₹{pred_damage_inr:,.0f}<br>
-                <b>Coordinates:</b> {lat:.6f}, {lon:.6f}<br>
-            </div>
-            """,
-            max_width=300
-        ),
-        tooltip=f"📍 {city_name} - {risk_level} Risk",
-        icon=folium.Icon(color=icon_color, icon="info-sign")
-    ).add_to(m)
-    
-    # Add risk area circle
-    folium.Circle(
-        location=[lat, lon],
-        radius=risk_radius,
-        popup=f"Risk Impact Area (~{risk_radius}m radius)",
-        color=RISK_COLORS[risk_level],
-        fill=True,
-        fillOpacity=0.2,
-        weight=3
-    ).add_to(m)
-    
-    return m
+
+    # Add click functionality
+    m.add_child(folium.LatLngPopup())
+
+    # Serialize once; the page is identical for every session
+    return folium.Figure().add_child(m).render()
 
 def create_coordinate_picker():
     """Create a LARGE map for users to click and get coordinates"""
@@ -143,99 +279,145 @@ def create_coordinate_picker():
     3. **Copy** the coordinates from popup
     4. **Paste** in Latitude/Longitude fields below
     """)
-    
-    # Create LARGE map centered on India
-    m = folium.Map(
-        location=[20.5937, 78.9629],
-        zoom_start=5,
-        tiles="OpenStreetMap"
-    )
-    
-    # Add click functionality
-    m.add_child(folium.LatLngPopup())
-    
+
     # Display the LARGE map in sidebar
-    folium_static(m, width=350, height=400)  # Increased size for better usability
+    st.iframe(_build_picker_html(), width=350, height=410)  # Increased size for better usability
 
 def plot_risk_probabilities(probas):
-    """Plot risk probability chart"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
+    """Build the risk probability chart (rendered client-side by Vega-Lite)"""
+    import altair as alt
+
     labels = list(RISK_LABELS.values())
-    colors = [RISK_COLORS[label] for label in labels]
-    
-    bars = ax.bar(labels, probas, color=colors, alpha=0.8, edgecolor='black', linewidth=1.2)
-    
-    ax.set_ylabel('Probability', fontsize=12, fontweight='bold')
-    ax.set_title('Flood Risk Probability Distribution', fontsize=14, fontweight='bold')
-    ax.set_ylim(0, 1)
-    ax.grid(axis='y', alpha=0.3)
-    
-    for bar, prob in zip(bars, probas):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                f'{prob:.1%}', ha='center', va='bottom', 
-                fontweight='bold', fontsize=11)
-    
-    plt.tight_layout()
-    return fig
+    data = pd.DataFrame({"Risk Level": labels, "Probability": probas})
 
-def plot_damage_estimate(pred_damage_inr):
-    """Plot damage estimate visualization in Rupees"""
-    fig, ax = plt.subplots(figsize=(8, 3))
-    
-    ax.barh(['Estimated Damage'], [pred_damage_inr], 
-            color='#ff6b6b', alpha=0.7, height=0.6)
-    
-    ax.set_xlabel('Damage Estimate (₹)', fontweight='bold')
-    ax.set_title('Predicted Flood Damage', fontweight='bold')
-    
-    ax.text(pred_damage_inr, 0, f'₹{pred_damage_inr:,.0f}', 
-            ha='left', va='center', fontweight='bold', 
-            fontsize=16, color='#333')
-    
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.grid(axis='x', alpha=0.3)
-    
-    plt.tight_layout()
-    return fig
+    base = alt.Chart(data, title="Flood Risk Probability Distribution").encode(
+        x=alt.X("Risk Level", sort=labels),
+        y=alt.Y("Probability", scale=alt.Scale(domain=[0, 1]), axis=alt.Axis(format="%"))
+    )
+    bars = base.mark_bar(opacity=0.8, stroke="black", strokeWidth=1.2).encode(
+        color=alt.Color(
+            "Risk Level",
+            scale=alt.Scale(domain=labels, range=[RISK_COLORS[label] for label in labels]),
+            legend=None
+        )
+    )
+    text = base.mark_text(dy=-8, fontWeight="bold").encode(
+        text=alt.Text("Probability", format=".1%")
+    )
+    return bars + text
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def predict_flood_risk(features_key):
+    """Predict risk probabilities, class and damage (INR) for one location
+
+    Results are cached on ``features_key``, the feature values in
+    NUM_FEATURES order.
+    """
+    # Built locally: this cache is shared across sessions, so it must not
+    # read or write any session's state. The pipeline's ColumnTransformer
+    # selects columns by name, hence the named frame.
+    X_input = pd.DataFrame(
+        np.asarray(features_key, dtype=np.float64).reshape(1, -1),
+        columns=NUM_FEATURES
+    )
+
+    probas, pred_log = run_in_pool(model_worker.predict, X_input)
+    probas = probas[0]
+    pred_idx = int(np.argmax(probas))
+
+    # Predict damage in USD and convert to INR
+    pred_damage_inr = math.expm1(float(pred_log[0])) * USD_TO_INR
 
-def convert_usd_to_inr(usd_amount):
-    """Convert USD amount to Indian Rupees"""
-    return usd_amount * USD_TO_INR
+    return probas, pred_idx, pred_damage_inr
+
+@functools.lru_cache(maxsize=4096)
+def _format_rupees_shown(unit, count):
+    """Format ``count`` multiples of ``unit`` rupees, i.e. the shown value"""
+    if unit == 100000:  # crore, 2 decimals
+        return f"₹{count / 100:.2f} crore"
+    elif unit == 1000:  # lakh, 2 decimals
+        return f"₹{count / 100:.2f} lakh"
+    else:
+        return f"₹{count:,}"
 
 def format_rupees(amount):
     """Format amount in Indian Rupees with proper formatting"""
+    # Cache on the value the string actually shows, so batch rows that
+    # display the same text share one entry without changing any output
     if amount >= 10000000:  # 1 crore
-        return f"₹{amount/10000000:.2f} crore"
+        return _format_rupees_shown(100000, int(round(amount / 100000)))
     elif amount >= 100000:  # 1 lakh
-        return f"₹{amount/100000:.2f} lakh"
+        return _format_rupees_shown(1000, int(round(amount / 1000)))
     else:
-        return f"₹{amount:,.0f}"
+        return _format_rupees_shown(1, int(round(amount)))
+
+@st.cache_data(max_entries=16, show_spinner="Analyzing flood risk for uploaded locations...")
+def predict_batch(csv_bytes):
+    """Predict risk and damage for every location in a CSV file's contents
+
+    Cached on the raw file bytes, so reruns while the same file stays
+    uploaded reuse the results. Returns the results frame and its CSV text.
+    """
+    try:
+        df = pd.read_csv(io.BytesIO(csv_bytes))
+    except Exception as e:
+        raise ValueError(f"Could not read CSV: {e}")
+
+    missing = [col for col in NUM_FEATURES if col not in df.columns]
+    if missing:
+        raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+
+    if df.empty:
+        raise ValueError("CSV has no rows")
+
+    # Non-numeric cells become NaN too, so both are reported the same way
+    X_batch = df[NUM_FEATURES].apply(pd.to_numeric, errors="coerce").astype(np.float64)
+    bad_rows = np.flatnonzero(X_batch.isna().any(axis=1).to_numpy()) + 1
+    if len(bad_rows):
+        shown = ", ".join(str(row) for row in bad_rows[:10])
+        more = f" and {len(bad_rows) - 10} more" if len(bad_rows) > 10 else ""
+        raise ValueError(f"CSV has missing or non-numeric feature values in rows: {shown}{more}")
+
+    # One pipeline call per model for the whole batch
+    probas, reg_log = run_in_pool(model_worker.predict, X_batch)
+    pred_idx = probas.argmax(axis=1)
+    pred_damage_inr = np.expm1(reg_log) * USD_TO_INR
+
+    results = df.copy()
+    results["risk_level"] = _RISK_LABEL_ARRAY[pred_idx]
+    results["p_high"] = probas[:, 2]
+    results["damage_inr"] = pred_damage_inr
+    results["damage"] = [format_rupees(amount) for amount in pred_damage_inr]
+    results["impact_radius_m"] = _RISK_RADII[pred_idx]
+
+    return results, results.to_csv(index=False)
+
+def display_batch_predictions(uploaded_file):
+    """Display predictions for every location in an uploaded CSV"""
+    st.header("📑 Batch Prediction Results")
+
+    try:
+        results, results_csv = predict_batch(uploaded_file.getvalue())
+    except ValueError as e:
+        st.error(str(e))
+        return
+    except Exception as e:
+        st.error(f"Batch prediction error: {e}")
+        return
+
+    st.dataframe(results, use_container_width=True)
+    st.download_button(
+        "⬇️ Download Results",
+        results_csv,
+        file_name="flood_risk_predictions.csv",
+        mime="text/csv"
+    )
 
 def display_emergency_contacts():
     """Display emergency contacts panel"""
     st.sidebar.markdown("---")
     st.sidebar.header("🆘 Emergency Contacts")
-    
-    contacts = [
-        {"name": "National Disaster Response Force (NDRF)", "number": "011-24363260", "icon": "🚨"},
-        {"name": "State Disaster Management Authority", "number": "1070", "icon": "🏛️"},
-        {"name": "Rescue Services", "number": "101", "icon": "🚑"},
-        {"name": "Ambulance (Medical Emergency)", "number": "108", "icon": "🏥"},
-        {"name": "Police", "number": "100", "icon": "👮"},
-        {"name": "Fire Department", "number": "102", "icon": "🚒"}
-    ]
-    
-    for contact in contacts:
-        with st.sidebar.container():
-            st.markdown(f"""
-            <div style='background-color: #f8f9fa; padding: 10px; border-radius: 5px; margin: 5px 0; border-left: 4px solid #dc3545;'>
-                <strong style='color: black;'>{contact['icon']} {contact['name']}</strong><br>
-                <span style='color: black;'>📞 {contact['number']}</span>
-            </div>
-            """, unsafe_allow_html=True)
+    st.sidebar.markdown(_CONTACTS_HTML, unsafe_allow_html=True)
 
 def display_safety_guidelines():
     """Display safety guidelines in expandable sections"""
@@ -277,26 +459,16 @@ def display_safety_guidelines():
             - Watch for electrical hazards
             """)
 
+@st.fragment
 def display_emergency_kit():
     """Display emergency kit checklist"""
+    # Ticking an item reruns only this fragment, not the whole app, so it no
+    # longer repeats the page build or clears displayed prediction results
     st.markdown("---")
     st.header("🎒 Emergency Kit Checklist")
     
-    kit_items = [
-        "💧 Water bottles (3+ days supply)",
-        "🔦 Flashlight with extra batteries",
-        "💊 Basic medicines & first aid kit",
-        "🔋 Power bank & charger",
-        "🍫 Dry snacks & non-perishable food",
-        "📄 Important documents (waterproof)",
-        "💰 Cash & emergency funds",
-        "🧥 Warm clothes & blankets",
-        "🧴 Hygiene & sanitation items",
-        "📱 Emergency contact list"
-    ]
-    
     cols = st.columns(2)
-    for i, item in enumerate(kit_items):
+    for i, item in enumerate(KIT_ITEMS):
         cols[i % 2].checkbox(item, key=f"kit_{i}")
 
 def display_affected_guidelines():
@@ -322,23 +494,11 @@ def display_help_others():
     st.markdown("---")
     st.header("🤝 How You Can Help Others")
     
-    organizations = [
-        {"name": "Red Cross India", "focus": "Emergency relief & medical aid", "url": "https://www.indianredcross.org/"},
-        {"name": "Goonj", "focus": "Material relief & rehabilitation", "url": "https://goonj.org/"},
-        {"name": "Hemkunt Foundation", "focus": "Disaster relief & community support", "url": "https://hemkuntfoundation.com/"},
-        {"name": "Local Municipal Relief Fund", "focus": "Direct local assistance", "url": "#"}
-    ]
-    
     st.info("""
     **Volunteer or support these organizations during floods:**
     """)
     
-    for org in organizations:
-        st.markdown(f"""
-        **{org['name']}**  
-        *{org['focus']}*  
-        🔗 [Learn More]({org['url']})
-        """)
+    st.markdown(_ORGANIZATIONS_MD)
 
 def display_donation_section():
     """Display donation links"""
@@ -370,28 +530,31 @@ def display_awareness_facts():
     st.markdown("---")
     st.header("💡 Flood Awareness Facts")
     
-    facts = [
-        "🌧️ **1 cm increase** in rainfall in low-elevation areas can raise flood chances by 10–15%",
-        "🏞️ **Urban areas** with >40% impervious surfaces are 3x more likely to experience flash floods",
-        "⏰ **Early warning** systems can reduce flood fatalities by up to 35%",
-        "🌳 **Natural vegetation** can absorb up to 90% of rainfall, reducing flood risk significantly",
-        "📈 **Climate change** has increased extreme rainfall events by 20% in the last decade"
-    ]
-    
-    for fact in facts:
-        st.info(fact)
+    st.info(_FACTS_MD)
 
 def main():
+    # Set page config
+    st.set_page_config(
+        page_title="Flood Risk Prediction Dashboard",
+        page_icon="🌊",
+        layout="wide"
+    )
+
+    # Alert Banner on Top
+    st.warning("⚠️ Always follow official guidelines during severe weather. This dashboard is only a prediction tool.", icon="🚨")
+
+    st.title("🌊 Flood Risk Prediction Dashboard")
+    st.success("✅ Version compatibility fix applied")
+
     # Load models first
-    clf, reg = load_models()
-    if clf is None or reg is None:
+    if not load_models():
         # Show installation instructions
         st.info("""
         ## 📋 Installation Instructions
         
         Please install the required packages:
         ```bash
-        pip install lightgbm streamlit pandas numpy matplotlib folium streamlit-folium scikit-learn joblib
+        pip install lightgbm streamlit pandas numpy folium scikit-learn joblib
         ```
         
         Then restart the app.
@@ -478,24 +641,23 @@ def main():
         for feature, value in features.items():
             st.write(f"**{feature}:** {value:.2f}")
     
+    # Batch predictions from CSV
+    st.sidebar.subheader("📂 Batch Prediction")
+    batch_file = st.sidebar.file_uploader(
+        "Batch CSV", type="csv",
+        help=f"One location per row with columns: {', '.join(NUM_FEATURES)}"
+    )
+
     # PREDICTION BUTTON MOVED BEFORE EMERGENCY CONTACTS
     st.sidebar.markdown("---")
     if st.sidebar.button("🚀 Predict Flood Risk", type="primary", use_container_width=True):
         with st.spinner("Analyzing flood risk..."):
             try:
-                # Prepare input data
-                X_input = pd.DataFrame([features], columns=NUM_FEATURES)
-                
-                # Make predictions
-                probas = clf.predict_proba(X_input)[0]
-                pred_idx = int(clf.predict(X_input)[0])
+                # Make predictions (cached on the input values)
+                features_key = tuple(features[k] for k in NUM_FEATURES)
+                probas, pred_idx, pred_damage_inr = predict_flood_risk(features_key)
                 pred_label = RISK_LABELS[pred_idx]
                 
-                # Predict damage in USD and convert to INR
-                pred_log = reg.predict(X_input)[0]
-                pred_damage_usd = float(np.expm1(pred_log))
-                pred_damage_inr = convert_usd_to_inr(pred_damage_usd)
-                
                 # Display results
                 st.header("📊 Prediction Results")
                 
@@ -550,10 +712,13 @@ def main():
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    st.pyplot(plot_risk_probabilities(probas))
+                    st.altair_chart(plot_risk_probabilities(probas), use_container_width=True)
                 
                 with col2:
-                    st.pyplot(plot_damage_estimate(pred_damage_inr))
+                    st.bar_chart(
+                        pd.DataFrame({"Damage Estimate (₹)": [pred_damage_inr]}, index=["Estimated Damage"]),
+                        color="#ff6b6b"
+                    )
                 
                 # Interactive Map - FULL SCREEN
                 st.subheader("🗺️ Location Map - Full Screen View")
@@ -562,9 +727,9 @@ def main():
                 st.info("""
                 **🗺️ Map Features:**
                 
-                📍 **Marker**: Your location with risk details (click to see details)  
+                📍 **Marker**: Your location with risk details (hover to see details)  
                 🎯 **Colored Circle**: Flood risk impact area  
-                🔍 **Zoom in/out**: Use mouse wheel or +/- buttons
+                🔍 **Zoom in/out**: Use mouse wheel or pinch; drag to pan
                 """)
                 
                 # Create FULL WIDTH map container
@@ -574,12 +739,15 @@ def main():
                         lat, lon, pred_label, probas[2], pred_damage_inr, city_name
                     )
                     # FULL SCREEN MAP - uses maximum available width
-                    folium_static(map_obj, width=1200, height=600)
+                    st.pydeck_chart(map_obj, use_container_width=True, height=600)
                 
             except Exception as e:
                 st.error(f"Prediction error: {e}")
                 st.info("Please check all input values and try again.")
 
+    if batch_file is not None:
+        display_batch_predictions(batch_file)
+
     # Emergency Contacts (now comes after prediction button)
     display_emergency_contacts()
 
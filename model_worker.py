@@ -0,0 +1,130 @@
+"""Model worker processes for flood risk inference.
+
+Streamlit executes the app script as a synthetic ``__main__`` module, so
+anything a ProcessPoolExecutor has to pickle by reference lives here.
+"""
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Pipelines were pickled with a different sklearn/LightGBM build; silence
+# their version and feature-name UserWarnings only, here and in workers
+warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+warnings.filterwarnings('ignore', category=UserWarning, module='lightgbm')
+
+# Models owned by this worker process, set by init_worker
+_clf = None
+_reg = None
+
+# Exception raised while loading the models, re-raised by ping
+_init_error = None
+
+# (columns, mean, scale, booster, n_classes) per model when the direct
+# path applies; n_classes is None for regressors
+_clf_fast = None
+_reg_fast = None
+
+def _patch_sklearn():
+    """Install the missing-class fix; must run before any pipeline is unpickled"""
+    # sklearn and joblib are imported here rather than at module level so the
+    # Streamlit server, which only imports this module, doesn't pay for them
+    import sklearn.compose._column_transformer
+
+    # FIX FOR MISSING CLASS - only patch sklearn versions that lack it,
+    # never shadow the real class
+    if not hasattr(sklearn.compose._column_transformer, "_RemainderColsList"):
+        class _RemainderColsList(list):
+            pass
+
+        # Patch the missing class
+        sklearn.compose._column_transformer._RemainderColsList = _RemainderColsList
+
+def _extract_fast_path(pipeline):
+    """Return (columns, mean, scale, booster, n_classes) for a StandardScaler ->
+    LightGBM pipeline, or None if it has any other shape"""
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    try:
+        (_, pre), (_, model) = pipeline.steps
+        active = [t for t in pre.transformers_ if not (isinstance(t[1], str) and t[1] == 'drop')]
+        if len(active) != 1 or pre.remainder != 'drop':
+            return None
+
+        _, scaler, columns = active[0]
+        # The shipped pipelines wrap the scaler in a one-step Pipeline
+        if isinstance(scaler, Pipeline) and len(scaler.steps) == 1:
+            scaler = scaler.steps[0][1]
+        if not isinstance(scaler, StandardScaler) or not all(isinstance(c, str) for c in columns):
+            return None
+
+        # mean_/scale_ are set even when centering/scaling is disabled
+        mean = scaler.mean_ if scaler.with_mean else None
+        scale = scaler.scale_ if scaler.with_std else None
+        n_classes = getattr(model, "n_classes_", None)
+        return list(columns), mean, scale, model.booster_, n_classes
+    except Exception:
+        return None
+
+def _fast_predict(fast, X):
+    """Scale X and run the LightGBM booster directly, skipping the sklearn wrappers"""
+    columns, mean, scale, booster, n_classes = fast
+    arr = X[columns].to_numpy(dtype=np.float64)
+    if mean is not None:
+        arr = arr - mean
+    if scale is not None:
+        arr = arr / scale
+    pred = booster.predict(np.ascontiguousarray(arr))
+
+    if n_classes is None:
+        return pred
+    if n_classes == 2:  # binary boosters return P(class 1) only
+        return np.column_stack([1 - pred, pred])
+    # Multiclass output is flat for zero rows, so reshape explicitly
+    return pred.reshape(-1, n_classes)
+
+def load_pipelines(clf_path, reg_path):
+    """Load the classification and regression pipelines concurrently"""
+    import joblib
+
+    _patch_sklearn()
+    # Model files are stored uncompressed, so their arrays can be
+    # memory-mapped and shared through the OS page cache
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        clf_future = ex.submit(joblib.load, clf_path, mmap_mode='r')
+        reg_future = ex.submit(joblib.load, reg_path, mmap_mode='r')
+        return clf_future.result(), reg_future.result()
+
+def init_worker(clf_path, reg_path):
+    """Load the classification and regression pipelines into this worker"""
+    global _clf, _reg, _clf_fast, _reg_fast, _init_error
+    # Keep the error for ping instead of raising: a failing initializer only
+    # marks the pool broken and loses the original message
+    try:
+        _clf, _reg = load_pipelines(clf_path, reg_path)
+    except Exception as e:
+        _init_error = e
+        return
+    _clf_fast = _extract_fast_path(_clf)
+    _reg_fast = _extract_fast_path(_reg)
+
+def ping():
+    """Raise the model loading error if this worker failed to initialize"""
+    if _init_error is not None:
+        raise _init_error
+
+def predict(X):
+    """Return (class probabilities, log damage in USD) for the rows of X"""
+    ping()
+
+    if _clf_fast is not None:
+        probas = _fast_predict(_clf_fast, X)
+    else:
+        probas = _clf.predict_proba(X)
+
+    if _reg_fast is not None:
+        reg_log = _fast_predict(_reg_fast, X)
+    else:
+        reg_log = _reg.predict(X)
+
+    return probas, reg_log
@@ -0,0 +1,76 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import final6_app  # noqa: E402
+
+
+@pytest.mark.parametrize("amount, expected", [
+    (0, "₹0"),
+    (12345.4, "₹12,345"),
+    (99999, "₹99,999"),
+    (100000, "₹1.00 lakh"),
+    (123456, "₹1.23 lakh"),
+    (9999000, "₹99.99 lakh"),
+    (10000000, "₹1.00 crore"),
+    (123456789, "₹12.35 crore"),
+])
+def test_format_rupees_thresholds(amount, expected):
+    assert final6_app.format_rupees(amount) == expected
+
+
+FEATURE_ROW = "100,250,600,12,1500,4000,0.6,3"
+
+
+@pytest.fixture
+def in_process_pool(monkeypatch):
+    pytest.importorskip("lightgbm")
+    import model_worker
+
+    model_worker.init_worker(
+        os.path.join(ROOT, "clf_pipeline.joblib"),
+        os.path.join(ROOT, "reg_pipeline.joblib")
+    )
+    monkeypatch.setattr(final6_app, "run_in_pool", lambda fn, *args: fn(*args))
+    final6_app.predict_batch.clear()
+    yield
+    final6_app.predict_batch.clear()
+
+
+def _csv(*rows):
+    return "\n".join([",".join(final6_app.NUM_FEATURES), *rows]).encode()
+
+
+def test_predict_batch_rejects_header_only_csv(in_process_pool):
+    with pytest.raises(ValueError, match="CSV has no rows"):
+        final6_app.predict_batch(_csv())
+
+
+def test_predict_batch_reports_missing_columns(in_process_pool):
+    with pytest.raises(ValueError, match="missing required columns: land_cover_index"):
+        final6_app.predict_batch(_csv(FEATURE_ROW).replace(b",land_cover_index", b""))
+
+
+def test_predict_batch_reports_incomplete_rows(in_process_pool):
+    csv_bytes = _csv(FEATURE_ROW, "100,,600,12,1500,4000,0.6,3", FEATURE_ROW, "100,250,600,n/a,1500,4000,0.6,3")
+    with pytest.raises(ValueError, match="rows: 2, 4$"):
+        final6_app.predict_batch(csv_bytes)
+
+
+def test_predict_batch_results(in_process_pool):
+    results, csv_text = final6_app.predict_batch(_csv(FEATURE_ROW, "5,10,40,80,200,300,0.1,1"))
+
+    assert len(results) == 2
+    assert set(results["risk_level"]) <= set(final6_app.RISK_LABELS.values())
+    assert results["p_high"].between(0, 1).all()
+    assert list(results["damage"]) == [final6_app.format_rupees(a) for a in results["damage_inr"]]
+    assert list(results["impact_radius_m"]) == [
+        final6_app._RISK_META[label][1] for label in results["risk_level"]
+    ]
+    assert csv_text.splitlines()[0].endswith("damage_inr,damage,impact_radius_m")
@@ -0,0 +1,99 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("lightgbm")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import model_worker  # noqa: E402
+
+NUM_FEATURES = [
+    "rainfall_mm", "rain_7d", "rain_30d",
+    "elevation", "dist_to_river",
+    "population_density", "impervious_frac", "land_cover_index"
+]
+
+
+@pytest.fixture(scope="module")
+def worker():
+    model_worker.init_worker(
+        os.path.join(ROOT, "clf_pipeline.joblib"),
+        os.path.join(ROOT, "reg_pipeline.joblib")
+    )
+    return model_worker
+
+
+@pytest.fixture(scope="module")
+def X():
+    df = pd.read_csv(os.path.join(ROOT, "imerg_synthetic.csv"), nrows=500)
+    return df[NUM_FEATURES]
+
+
+def test_fast_path_taken_for_shipped_models(worker):
+    assert worker._clf_fast is not None
+    assert worker._reg_fast is not None
+
+
+def test_fast_path_matches_pipelines(worker, X):
+    probas, reg_log = worker.predict(X)
+    np.testing.assert_allclose(probas, worker._clf.predict_proba(X))
+    np.testing.assert_allclose(reg_log, worker._reg.predict(X))
+
+
+def test_single_row_prediction_shapes(worker, X):
+    probas, reg_log = worker.predict(X.iloc[:1])
+    assert probas.shape == (1, 3)
+    assert reg_log.shape == (1,)
+
+
+def test_zero_rows_keep_class_columns(worker, X):
+    probas, reg_log = worker.predict(X.iloc[:0])
+    assert probas.shape == (0, 3)
+    assert reg_log.shape == (0,)
+
+
+def test_fast_path_respects_disabled_centering(X):
+    from lightgbm import LGBMClassifier
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    df = pd.read_csv(os.path.join(ROOT, "imerg_synthetic.csv"), nrows=2000)
+    pipeline = Pipeline([
+        ("pre", ColumnTransformer([
+            ("num", Pipeline([("scaler", StandardScaler(with_mean=False))]), NUM_FEATURES)
+        ])),
+        ("clf", LGBMClassifier(n_estimators=20, verbose=-1, random_state=0)),
+    ]).fit(df[NUM_FEATURES], df["risk_label"])
+
+    fast = model_worker._extract_fast_path(pipeline)
+    assert fast is not None
+    assert fast[1] is None
+    np.testing.assert_allclose(
+        model_worker._fast_predict(fast, X), pipeline.predict_proba(X)
+    )
+
+
+def test_fast_path_binary_classifier(X):
+    from lightgbm import LGBMClassifier
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    df = pd.read_csv(os.path.join(ROOT, "imerg_synthetic.csv"), nrows=2000)
+    pipeline = Pipeline([
+        ("pre", ColumnTransformer([("num", StandardScaler(), NUM_FEATURES)])),
+        ("clf", LGBMClassifier(n_estimators=20, verbose=-1, random_state=0)),
+    ]).fit(df[NUM_FEATURES], df["risk_label"] == 2)
+
+    fast = model_worker._extract_fast_path(pipeline)
+    assert fast is not None
+    np.testing.assert_allclose(
+        model_worker._fast_predict(fast, X), pipeline.predict_proba(X)
+    )
+    assert model_worker._fast_predict(fast, X.iloc[:0]).shape == (0, 2)